@@ -1,29 +1,47 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once after load_dotenv() so the getters below do a
+# plain dict lookup instead of re-entering os.environ on every call
+_ENV = dict(os.environ)
+
+@lru_cache(maxsize=1)
 def get_openai_api_key():
     """Get OpenAI API key from environment variables"""
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = _ENV.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY environment variable.")
     return api_key
 
+@lru_cache(maxsize=1)
 def get_pinecone_api_key():
     """Get Pinecone API key from environment variables"""
-    api_key = os.getenv("PINECONE_API_KEY")
+    api_key = _ENV.get("PINECONE_API_KEY")
     if not api_key:
         print("Warning: Pinecone API key not found. Local storage will be used as fallback.")
     return api_key
 
+@lru_cache(maxsize=1)
 def get_pinecone_environment():
     """Get Pinecone environment from environment variables"""
-    env = os.getenv("PINECONE_ENVIRONMENT", "us-west1-gcp")
+    env = _ENV.get("PINECONE_ENVIRONMENT", "us-west1-gcp")
     return env
 
+@lru_cache(maxsize=1)
 def get_pinecone_index_name():
     """Get Pinecone index name from environment variables"""
-    index_name = os.getenv("PINECONE_INDEX_NAME", "interview-questions")
-    return index_name
\ No newline at end of file
+    index_name = _ENV.get("PINECONE_INDEX_NAME", "interview-questions")
+    return index_name
+
+def clear_config_cache():
+    """Re-read the environment and clear cached config values (for tests)"""
+    global _ENV
+    _ENV = dict(os.environ)
+    get_openai_api_key.cache_clear()
+    get_pinecone_api_key.cache_clear()
+    get_pinecone_environment.cache_clear()
+    get_pinecone_index_name.cache_clear()
@@ -1,31 +1,194 @@
 import os
+import io
+import re
 import json
-from typing import List
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.chains import LLMChain
-from langchain.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+import hashlib
+import functools
+import itertools
 from app.question_bank import QuestionBank
 from dotenv import load_dotenv
 import time
+import asyncio
 import logging
-import openai
+import weakref
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-class QuestionSet(BaseModel):
-    questions: List[str] = Field(description="List of interview questions")
+# Optional streaming JSON parser; orjson (C decoder) then stdlib json are
+# the fallbacks
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cache for API-generated question sets, keyed on normalized inputs so
+# identical or trivially-respelled requests return in microseconds and cost
+# nothing (persistent when diskcache is installed)
+from app.utils.llm_cache import LLMCache
+
+_llm_cache = LLMCache()
+
+def _parse_question_array(json_str, num_questions):
+    """
+    Parse a JSON array of question strings, keeping at most num_questions.
+
+    With ijson available, items are streamed and parsing stops as soon as
+    enough questions have been read (the model often returns more than
+    requested). Returns None if the array isn't a list of strings so callers
+    can fall through to the plain-text parse.
+    """
+    if ijson is not None:
+        items = ijson.items(io.StringIO(json_str), 'item')
+        questions = list(itertools.islice(
+            (q for q in items if isinstance(q, str)), num_questions))
+        return questions or None
+    if orjson is not None:
+        questions = orjson.loads(json_str)
+    else:
+        questions = json.loads(json_str)
+    if isinstance(questions, list) and all(isinstance(q, str) for q in questions):
+        return questions[:num_questions]
+    return None
+
+# Keys already validated against the API in this process, keyed by a
+# truncated hash so the key itself is never stored
+_API_KEY_VALIDATED = {}
+
+@functools.lru_cache(maxsize=1)
+def _shared_bank():
+    """Single QuestionBank shared by every QuestionGenerator instance"""
+    return QuestionBank()
+
+@functools.lru_cache(maxsize=256)
+def _local_lookup(bank, job_role, experience_level, num_questions):
+    """
+    Memoized local-bank lookup. Deterministic for a given bank instance
+    (keyed by object identity), so repeat calls are O(1). Returns an
+    immutable tuple; callers wrap with list() to keep the API contract.
+    """
+    return tuple(bank.get_questions(
+        job_role=job_role,
+        experience_level=experience_level,
+        num_questions=num_questions
+    ))
+
+# Precompiled patterns for parsing LLM responses: one pass to strip
+# "- " / "1. " list prefixes, one scan to find the JSON array
+_PREFIX_RE = re.compile(r'^\s*(?:-\s*|\d+\.\s*)')
+_JSON_ARR_RE = re.compile(r'\[.*\]', re.DOTALL)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# JSON schema for the native OpenAI structured-output mode: the API then
+# guarantees a valid {"questions": [...]} object, so no text-level
+# fallback parsing is needed on this path
+_QUESTION_SET_SCHEMA = {
+    "name": "QuestionSet",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "questions": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["questions"],
+        "additionalProperties": False,
+    },
+    "strict": True,
+}
+
+# Prompt templates are plain-string constants rendered per call with
+# str.format — no per-call template parsing or callback machinery.
+# Each prompt is split into a byte-identical static system prefix (eligible
+# for provider-side prompt caching) and a trailing human message carrying
+# only the dynamic fields.
+_SYSTEM_GENERIC = """
+You are an expert interviewer generating interview questions.
+
+Rules:
+1. Questions must be specific to the target role and the required skills
+2. Mix of technical (70%) and behavioral (30%) questions
+3. Technical questions should focus on practical application
+4. Questions should be challenging but fair for the stated experience level
+5. Avoid generic questions that could apply to any role
+6. Each question should be unique and specific
+
+Format: Return as a JSON list of questions.
+"""
+
+_HUMAN_GENERIC = """
+Generate {num_questions} interview questions for a {experience_level} {job_role} position.
+Required skills: {skills_str}
+"""
+
+_HUMAN_TYPED = """
+Generate {num_questions} {question_type} interview questions for a {experience_level} {job_role} position.
+Required skills: {skills_str}
+"""
+
+_SYSTEM_PERSONALIZED = """
+You are an expert interviewer generating personalized interview questions
+from a candidate's resume.
+
+Rules:
+1. Questions must be specific to the candidate's experience and skills
+2. Focus on areas where candidate's experience matches job requirements
+3. Ask about specific projects/achievements from their resume
+4. Mix of technical (70%) and behavioral (30%) questions
+5. Questions should be challenging but fair for the stated experience level
+6. Each question should be unique and personalized
+
+Format: Return as a JSON list of questions.
+"""
+
+_HUMAN_PERSONALIZED = """
+Generate {num_questions} personalized interview questions for a {experience_level} {job_role} position.
+
+Job Requirements:
+- Required skills: {skills_str}
+
+Candidate Profile:
+- Resume: {resume_text}
+- Extracted skills: {extracted_skills_str}
+"""
+
+_SYSTEM_FUSED = """
+You are helping prepare a candidate for an interview.
+
+Tasks:
+1. Extract the candidate's technical and soft skills from the resume
+2. Generate the requested number of personalized interview questions following these rules:
+   - Questions must be specific to the candidate's experience and skills
+   - Focus on areas where candidate's experience matches job requirements
+   - Ask about specific projects/achievements from their resume
+   - Mix of technical (70%) and behavioral (30%) questions
+   - Questions should be challenging but fair for the stated experience level
+
+Format: Return a single JSON object:
+{"extracted_skills": ["skill", ...], "questions": ["question", ...]}
+"""
+
+_HUMAN_FUSED = """
+Generate {num_questions} personalized interview questions for a {experience_level} {job_role} position.
+
+Job Requirements:
+- Required skills: {skills_str}
+
+Candidate Resume:
+{resume_text}
+"""
 
 class QuestionGenerator:
-    def __init__(self):
+    def __init__(self, validate=False, model="gpt-4o-mini"):
         try:
-            # Initialize local question bank
-            self.question_bank = QuestionBank()
+            # Initialize local question bank (shared across instances)
+            self.question_bank = _shared_bank()
             
             # Initialize OpenAI API
             openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -36,25 +199,47 @@ class QuestionGenerator:
                     self.use_api = False
                 else:
                     try:
-                        # Test the API key
-                        openai.api_key = openai_api_key
-                        openai.models.list()  # This will fail if the key is invalid
-                        
-                        logger.info("Initializing OpenAI API with GPT-3.5-turbo")
-                        self.llm = ChatOpenAI(
-                            model_name="gpt-3.5-turbo",
-                            temperature=0.7,
-                            openai_api_key=openai_api_key,
-                            max_retries=3,
-                            request_timeout=30
-                        )
-                        self.output_parser = PydanticOutputParser(pydantic_object=QuestionSet)
+                        # Deferred so local-only users never pay the openai import
+                        from app.utils.ai_utils import get_openai_client, get_async_openai_client
+
+                        # Only probe the API when explicitly requested; the format
+                        # check above is enough and the first real call will surface
+                        # auth errors anyway. Validation results are cached per key.
+                        if validate:
+                            key_id = hashlib.blake2b(openai_api_key.encode(), digest_size=8).hexdigest()
+                            if key_id not in _API_KEY_VALIDATED:
+                                get_openai_client().models.list()  # This will fail if the key is invalid
+                                _API_KEY_VALIDATED[key_id] = True
+
+                        logger.info("Initializing OpenAI API with %s", model)
+                        # Process-wide clients shared with ResumeParser and
+                        # ai_utils, so all OpenAI traffic reuses one warm
+                        # connection pool
+                        self._openai_client = get_openai_client()
+                        self._openai_aclient = get_async_openai_client()
+                        self.model_name = model
                         self.use_api = True
-                        self.last_api_call = 0
                         self.min_delay = 2  # Increased delay to respect rate limits
+                        # Monotonic clock is immune to NTP/wall-clock jumps;
+                        # back-date so the first call never sleeps
+                        self.last_api_call = time.monotonic() - self.min_delay
+                        # Concurrency gates per event loop: a Semaphore
+                        # binds to the loop that first blocks on it, so one
+                        # shared instance would raise under Flask async
+                        # views (fresh loop per request). Weak keys let a
+                        # gate die with its loop.
+                        self._async_sems = weakref.WeakKeyDictionary()
+                        # In-flight async requests per event loop, keyed by
+                        # input digest, so concurrent identical requests
+                        # share one API call. Tasks belong to the loop that
+                        # created them (awaiting across loops raises), and
+                        # callers like Flask async views run each request in
+                        # a fresh loop — weak keys let a map die with its
+                        # loop.
+                        self._inflight = weakref.WeakKeyDictionary()
                         self.api_key_valid = True
                     except Exception as e:
-                        logger.error(f"Invalid OpenAI API key: {str(e)}")
+                        logger.error("Invalid OpenAI API key: %s", e)
                         self.use_api = False
                         self.api_key_valid = False
             else:
@@ -63,70 +248,129 @@ class QuestionGenerator:
                 self.api_key_valid = False
                 
         except Exception as e:
-            logger.error(f"Error initializing QuestionGenerator: {str(e)}")
+            # The bank was already assigned on the first line of the try
+            # block (a shared-instance lookup that cannot raise), so only the
+            # API flags need resetting here
+            logger.error("Error initializing QuestionGenerator: %s", e)
             self.use_api = False
             self.api_key_valid = False
-            self.question_bank = QuestionBank()
     
     def _wait_for_rate_limit(self):
-        """Wait if needed to respect rate limits"""
-        if self.use_api and self.api_key_valid:
-            current_time = time.time()
-            time_since_last_call = current_time - self.last_api_call
-            if time_since_last_call < self.min_delay:
-                time.sleep(self.min_delay - time_since_last_call)
-            self.last_api_call = time.time()
+        """Wait if needed to respect rate limits (callers only invoke this on the API path)"""
+        delay = self.min_delay - (time.monotonic() - self.last_api_call)
+        if delay > 0:
+            time.sleep(delay)
+        self.last_api_call = time.monotonic()
+
+    def _chat(self, system_msg, user_msg):
+        """
+        Plain chat completion returning the raw response text. Used as the
+        fallback when the structured-output mode is unavailable; callers
+        parse the text themselves.
+        """
+        response = self._openai_client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_msg},
+                {"role": "user", "content": user_msg},
+            ],
+            temperature=0.7,
+        )
+        return response.choices[0].message.content
+
+    async def _achat(self, system_msg, user_msg):
+        """Async counterpart of _chat"""
+        response = await self._openai_aclient.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_msg},
+                {"role": "user", "content": user_msg},
+            ],
+            temperature=0.7,
+        )
+        return response.choices[0].message.content
+
+    def _structured_questions(self, system_msg, user_msg, num_questions):
+        """
+        Call the OpenAI JSON-schema mode directly. The API guarantees a
+        response matching _QUESTION_SET_SCHEMA, so there is nothing to
+        repair client-side. Raises if the model rejects structured output;
+        callers fall back to the chain + text-parse path.
+        """
+        response = self._openai_client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_msg},
+                {"role": "user", "content": user_msg},
+            ],
+            temperature=0.7,
+            response_format={"type": "json_schema", "json_schema": _QUESTION_SET_SCHEMA},
+        )
+        data = (orjson or json).loads(response.choices[0].message.content)
+        return [q for q in data["questions"] if isinstance(q, str)][:num_questions]
         
     def generate_questions(self, job_role, experience_level, skills, num_questions=10, question_types=None):
         """
         Generate interview questions based on job role, experience level, and skills.
         Falls back to local question bank if API is not available or quota is exceeded.
         """
-        logger.info(f"Generating questions for {job_role} ({experience_level})")
+        logger.info("Generating questions for %s (%s)", job_role, experience_level)
         
         if not job_role or not experience_level or not skills:
             logger.error("Missing required parameters")
             raise ValueError("Missing required parameters")
             
         if num_questions < 1 or num_questions > 50:
-            logger.error(f"Invalid number of questions: {num_questions}")
+            logger.error("Invalid number of questions: %s", num_questions)
             raise ValueError("Number of questions must be between 1 and 50")
-            
+
+        # Computed once, outside the retrying API call
+        skills_str = ", ".join(skills)
+
         try:
             # Try using API if available and valid
             if self.use_api and self.api_key_valid:
                 try:
+                    # Identical inputs hit the persistent cache and skip the API
+                    cache_key = _llm_cache.make_key(job_role, experience_level, skills, question_types,
+                                                    num_questions, self.model_name)
+                    cached = _llm_cache.get(cache_key)
+                    if cached:
+                        logger.info("Returning cached questions")
+                        return list(cached)
+
                     self._wait_for_rate_limit()
-                    
-                    # Prepare the prompt with more specific instructions
-                    prompt_template = """
-                    Generate {num_questions} interview questions for a {experience_level} {job_role} position.
-                    Required skills: {skills_str}
-                    
-                    Rules:
-                    1. Questions must be specific to {job_role} and the required skills
-                    2. Mix of technical (70%) and behavioral (30%) questions
-                    3. Technical questions should focus on practical application
-                    4. Questions should be challenging but fair for {experience_level}
-                    5. Avoid generic questions that could apply to any role
-                    6. Each question should be unique and specific
-                    
-                    Format: Return as a JSON list of questions.
-                    """
-                    
-                    # Create the prompt
-                    prompt = ChatPromptTemplate.from_template(template=prompt_template)
-                    
-                    # Create the chain
-                    chain = LLMChain(llm=self.llm, prompt=prompt)
-                    
-                    # Run the chain
+
+                    # Prefer the structured-output call: no client-side
+                    # parsing fallbacks and no retry round-trips on malformed
+                    # responses
+                    try:
+                        questions = self._structured_questions(
+                            _SYSTEM_GENERIC,
+                            _HUMAN_GENERIC.format(
+                                num_questions=num_questions,
+                                experience_level=experience_level,
+                                job_role=job_role,
+                                skills_str=skills_str
+                            ),
+                            num_questions
+                        )
+                        if questions:
+                            _llm_cache.set(cache_key, questions)
+                            return questions
+                    except Exception as e:
+                        logger.warning("Structured output call failed (%s); using prompt chain", e)
+
+                    # Plain-text call with the same prompt
                     logger.info("Making API call to generate questions")
-                    result = chain.run(
-                        num_questions=num_questions,
-                        experience_level=experience_level,
-                        job_role=job_role,
-                        skills_str=", ".join(skills)
+                    result = self._chat(
+                        _SYSTEM_GENERIC,
+                        _HUMAN_GENERIC.format(
+                            num_questions=num_questions,
+                            experience_level=experience_level,
+                            job_role=job_role,
+                            skills_str=skills_str
+                        )
                     )
                     
                     # Parse the result
@@ -135,29 +379,28 @@ class QuestionGenerator:
                         if isinstance(result, str):
                             logger.info("Processing API response")
                             # Look for JSON-like structure
-                            start_idx = result.find('[')
-                            end_idx = result.rfind(']') + 1
-                            if start_idx >= 0 and end_idx > start_idx:
-                                json_str = result[start_idx:end_idx]
-                                questions = json.loads(json_str)
-                                if isinstance(questions, list) and all(isinstance(q, str) for q in questions):
-                                    logger.info(f"Successfully generated {len(questions)} questions")
-                                    return questions[:num_questions]
-                            
+                            match = _JSON_ARR_RE.search(result)
+                            if match:
+                                questions = _parse_question_array(match.group(0), num_questions)
+                                if questions:
+                                    logger.info("Successfully generated %d questions", len(questions))
+                                    _llm_cache.set(cache_key, questions)
+                                    return questions
+
                             # If no JSON found, try to extract questions from text
-                            questions = [q.strip() for q in result.split('\n') if q.strip()]
-                            questions = [q.replace("- ", "").replace("1.", "").replace("2.", "").replace("3.", "").replace("4.", "").replace("5.", "") for q in questions]
-                            questions = [q.strip() for q in questions if q.strip()]
-                            logger.info(f"Successfully extracted {len(questions)} questions from text")
-                            return questions[:num_questions]
+                            questions = [_PREFIX_RE.sub('', q).strip() for q in result.split('\n') if q.strip()]
+                            questions = [q for q in questions if q][:num_questions]
+                            logger.info("Successfully extracted %d questions from text", len(questions))
+                            _llm_cache.set(cache_key, questions)
+                            return questions
                             
                     except Exception as e:
-                        logger.error(f"Error parsing API response: {str(e)}")
+                        logger.error("Error parsing API response: %s", e)
                         logger.info("Falling back to local questions")
                         return self._get_local_questions(job_role, experience_level, num_questions)
                         
                 except Exception as e:
-                    logger.error(f"API error: {str(e)}")
+                    logger.error("API error: %s", e)
                     logger.info("Falling back to local questions")
                     return self._get_local_questions(job_role, experience_level, num_questions)
             else:
@@ -165,21 +408,157 @@ class QuestionGenerator:
                 return self._get_local_questions(job_role, experience_level, num_questions)
                 
         except Exception as e:
-            logger.error(f"Error generating questions: {str(e)}")
+            logger.error("Error generating questions: %s", e)
             raise    
-    def _get_local_questions(self, job_role, experience_level, num_questions):
-        """Get questions from the local question bank"""
-        logger.info(f"Getting local questions for {job_role} ({experience_level})")
+    def _loop_semaphore(self, concurrency):
+        """Concurrency semaphore bound to the current event loop"""
+        loop = asyncio.get_running_loop()
+        sem = self._async_sems.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(concurrency)
+            self._async_sems[loop] = sem
+        return sem
+
+    async def _await_rate_limit(self):
+        """Async counterpart of _wait_for_rate_limit using asyncio.sleep"""
+        delay = self.min_delay - (time.monotonic() - self.last_api_call)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.last_api_call = time.monotonic()
+
+    async def agenerate_questions(self, job_role, experience_level, skills,
+                                  num_questions=10, question_types=None, concurrency=4):
+        """
+        Async variant of generate_questions. Concurrent callers overlap the
+        OpenAI HTTP latency (bounded by a semaphore) instead of serializing
+        behind the blocking rate limiter, and concurrent identical requests
+        are coalesced into a single API call. Falls back to the local
+        question bank if the API is not available.
+        """
+        if not job_role or not experience_level or not skills:
+            raise ValueError("Missing required parameters")
+
+        if num_questions < 1 or num_questions > 50:
+            raise ValueError("Number of questions must be between 1 and 50")
+
+        if not (self.use_api and self.api_key_valid):
+            return self._get_local_questions(job_role, experience_level, num_questions)
+
+        # Identical inputs hit the persistent cache and skip the API,
+        # same as the sync path
+        key = _llm_cache.make_key(job_role, experience_level, skills, question_types,
+                                  num_questions, self.model_name)
+        cached = _llm_cache.get(key)
+        if cached:
+            logger.info("Returning cached questions")
+            return list(cached)
+
+        sem = self._loop_semaphore(concurrency)
+
+        # Coalesce duplicate in-flight requests within this event loop:
+        # later arrivals await the task already running for the same inputs
+        # instead of spending RPM. The map is scoped per loop because a
+        # task can only be awaited from the loop that owns it.
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(loop)
+        if inflight is None:
+            inflight = {}
+            self._inflight[loop] = inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._agenerate_cached(
+                key, sem, job_role, experience_level, skills, num_questions, question_types))
+            inflight[key] = task
+            task.add_done_callback(lambda _t: inflight.pop(key, None))
+
+        # Shield so one cancelled waiter doesn't kill the shared call
+        return list(await asyncio.shield(task))
+
+    async def _agenerate_cached(self, key, sem, job_role, experience_level, skills,
+                                num_questions, question_types):
+        """
+        Run the fanout and persist API successes in the response cache.
+        Local-bank fallbacks are deliberately not cached, so the API is
+        retried once it recovers.
+        """
         try:
-            questions = self.question_bank.get_questions(
+            questions = await self._agenerate_fanout(
+                sem, job_role, experience_level, skills, num_questions, question_types)
+        except Exception as e:
+            logger.error("API error: %s", e)
+            logger.info("Falling back to local questions")
+            return self._get_local_questions(job_role, experience_level, num_questions)
+
+        if questions:
+            _llm_cache.set(key, questions)
+        return questions
+
+    async def _agenerate_fanout(self, sem, job_role, experience_level, skills, num_questions, question_types):
+        """
+        Fan out one smaller API call per requested question type and run them
+        concurrently. Each sub-call produces less output and its prompt is
+        shorter, so two parallel calls finish well before one combined call.
+        Single-type (or unspecified) requests go straight to one call.
+        """
+        if not question_types or len(question_types) < 2:
+            question_type = question_types[0] if question_types else None
+            return await self._agenerate_remote(
+                sem, job_role, experience_level, skills, num_questions, question_type)
+
+        # Split the budget across types; earlier types absorb the remainder
+        base, rem = divmod(num_questions, len(question_types))
+        counts = [base + (1 if i < rem else 0) for i in range(len(question_types))]
+
+        results = await asyncio.gather(*[
+            self._agenerate_remote(sem, job_role, experience_level, skills, count, question_type)
+            for question_type, count in zip(question_types, counts) if count
+        ])
+        return [q for batch in results for q in batch]
+
+    async def _agenerate_remote(self, sem, job_role, experience_level, skills, num_questions, question_type=None):
+        """
+        Single API round-trip for agenerate_questions. Raises on API
+        failure; _agenerate_cached falls back to the local bank for the
+        whole request.
+        """
+        if question_type:
+            user_msg = _HUMAN_TYPED.format(
+                num_questions=num_questions,
+                question_type=question_type.lower(),
+                experience_level=experience_level,
                 job_role=job_role,
+                skills_str=", ".join(skills)
+            )
+        else:
+            user_msg = _HUMAN_GENERIC.format(
+                num_questions=num_questions,
                 experience_level=experience_level,
-                num_questions=num_questions
+                job_role=job_role,
+                skills_str=", ".join(skills)
             )
-            logger.info(f"Successfully retrieved {len(questions)} local questions")
+
+        async with sem:
+            await self._await_rate_limit()
+            result = await self._achat(_SYSTEM_GENERIC, user_msg)
+
+        match = _JSON_ARR_RE.search(result)
+        if match:
+            questions = _parse_question_array(match.group(0), num_questions)
+            if questions:
+                return questions
+
+        questions = [_PREFIX_RE.sub('', q).strip() for q in result.split('\n') if q.strip()]
+        return [q for q in questions if q][:num_questions]
+
+    def _get_local_questions(self, job_role, experience_level, num_questions):
+        """Get questions from the local question bank"""
+        logger.info("Getting local questions for %s (%s)", job_role, experience_level)
+        try:
+            questions = list(_local_lookup(self.question_bank, job_role, experience_level, num_questions))
+            logger.info("Successfully retrieved %d local questions", len(questions))
             return questions
         except Exception as e:
-            logger.error(f"Error getting local questions: {str(e)}")
+            logger.error("Error getting local questions: %s", e)
             # Return some default questions if local bank fails
             return [
                 f"Tell me about your experience with {job_role}.",
@@ -200,49 +579,48 @@ class QuestionGenerator:
             
         if num_questions < 1 or num_questions > 50:
             raise ValueError("Number of questions must be between 1 and 50")
-            
+
+        # Computed once, outside the retrying API call
+        skills_str = ", ".join(skills)
+        resume_snippet = resume_text[:2000]  # Limit resume text
+        extracted_skills_str = ", ".join(extracted_skills)
+
         try:
             # Try using API if available
             if self.use_api:
                 try:
                     self._wait_for_rate_limit()
-                    
-                    # Prepare the prompt with more specific instructions
-                    prompt_template = """
-                    Generate {num_questions} personalized interview questions for a {experience_level} {job_role} position.
-                    
-                    Job Requirements:
-                    - Required skills: {skills_str}
-                    
-                    Candidate Profile:
-                    - Resume: {resume_text}
-                    - Extracted skills: {extracted_skills_str}
-                    
-                    Rules:
-                    1. Questions must be specific to the candidate's experience and skills
-                    2. Focus on areas where candidate's experience matches job requirements
-                    3. Ask about specific projects/achievements from their resume
-                    4. Mix of technical (70%) and behavioral (30%) questions
-                    5. Questions should be challenging but fair for {experience_level}
-                    6. Each question should be unique and personalized
-                    
-                    Format: Return as a JSON list of questions.
-                    """
-                    
-                    # Create the prompt
-                    prompt = ChatPromptTemplate.from_template(template=prompt_template)
-                    
-                    # Create the chain
-                    chain = LLMChain(llm=self.llm, prompt=prompt)
-                    
-                    # Run the chain
-                    result = chain.run(
-                        num_questions=num_questions,
-                        experience_level=experience_level,
-                        job_role=job_role,
-                        skills_str=", ".join(skills),
-                        resume_text=resume_text[:2000],  # Limit resume text
-                        extracted_skills_str=", ".join(extracted_skills)
+
+                    # Prefer the structured-output call (see generate_questions)
+                    try:
+                        questions = self._structured_questions(
+                            _SYSTEM_PERSONALIZED,
+                            _HUMAN_PERSONALIZED.format(
+                                num_questions=num_questions,
+                                experience_level=experience_level,
+                                job_role=job_role,
+                                skills_str=skills_str,
+                                resume_text=resume_snippet,
+                                extracted_skills_str=extracted_skills_str
+                            ),
+                            num_questions
+                        )
+                        if questions:
+                            return questions
+                    except Exception as e:
+                        logger.warning("Structured output call failed (%s); using prompt chain", e)
+
+                    # Plain-text call with the same prompt
+                    result = self._chat(
+                        _SYSTEM_PERSONALIZED,
+                        _HUMAN_PERSONALIZED.format(
+                            num_questions=num_questions,
+                            experience_level=experience_level,
+                            job_role=job_role,
+                            skills_str=skills_str,
+                            resume_text=resume_snippet,
+                            extracted_skills_str=extracted_skills_str
+                        )
                     )
                     
                     # Parse the result
@@ -250,18 +628,15 @@ class QuestionGenerator:
                         # Try to extract questions from the response
                         if isinstance(result, str):
                             # Look for JSON-like structure
-                            start_idx = result.find('[')
-                            end_idx = result.rfind(']') + 1
-                            if start_idx >= 0 and end_idx > start_idx:
-                                json_str = result[start_idx:end_idx]
-                                questions = json.loads(json_str)
-                                if isinstance(questions, list) and all(isinstance(q, str) for q in questions):
-                                    return questions[:num_questions]
-                            
+                            match = _JSON_ARR_RE.search(result)
+                            if match:
+                                questions = _parse_question_array(match.group(0), num_questions)
+                                if questions:
+                                    return questions
+
                             # If no JSON found, try to extract questions from text
-                            questions = [q.strip() for q in result.split('\n') if q.strip()]
-                            questions = [q.replace("- ", "").replace("1.", "").replace("2.", "").replace("3.", "").replace("4.", "").replace("5.", "") for q in questions]
-                            questions = [q.strip() for q in questions if q.strip()]
+                            questions = [_PREFIX_RE.sub('', q).strip() for q in result.split('\n') if q.strip()]
+                            questions = [q for q in questions if q]
                             return questions[:num_questions]
                             
                     except Exception as e:
@@ -278,3 +653,58 @@ class QuestionGenerator:
         except Exception as e:
             print(f"Error generating personalized questions: {str(e)}")
             raise
+
+    def generate_personalized_questions_fused(self, resume_text, job_role, experience_level,
+                                              skills, num_questions=10, question_types=None):
+        """
+        Generate personalized questions and extract resume skills in a single
+        API call, saving the separate skill-extraction round-trip.
+        Falls back to the local question bank if the API is not available.
+
+        Returns:
+            tuple: (questions, extracted_skills)
+        """
+        if not resume_text or not job_role or not experience_level or not skills:
+            raise ValueError("Missing required parameters")
+
+        if num_questions < 1 or num_questions > 50:
+            raise ValueError("Number of questions must be between 1 and 50")
+
+        if not (self.use_api and self.api_key_valid):
+            return self._get_local_questions(job_role, experience_level, num_questions), []
+
+        skills_str = ", ".join(skills)
+        resume_snippet = resume_text[:2000]  # Limit resume text
+
+        try:
+            self._wait_for_rate_limit()
+
+            result = self._chat(
+                _SYSTEM_FUSED,
+                _HUMAN_FUSED.format(
+                    num_questions=num_questions,
+                    experience_level=experience_level,
+                    job_role=job_role,
+                    skills_str=skills_str,
+                    resume_text=resume_snippet
+                )
+            )
+
+            if isinstance(result, str):
+                match = _JSON_OBJ_RE.search(result)
+                if match:
+                    data = (orjson or json).loads(match.group(0))
+                    questions = data.get("questions")
+                    extracted_skills = data.get("extracted_skills")
+                    if (isinstance(questions, list) and all(isinstance(q, str) for q in questions)
+                            and isinstance(extracted_skills, list)):
+                        extracted_skills = [s for s in extracted_skills if isinstance(s, str)]
+                        return questions[:num_questions], extracted_skills
+
+            logger.error("Could not parse fused API response")
+            return self._get_local_questions(job_role, experience_level, num_questions), []
+
+        except Exception as e:
+            logger.error("API error: %s", e)
+            logger.info("Falling back to local questions")
+            return self._get_local_questions(job_role, experience_level, num_questions), []
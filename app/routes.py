@@ -2,8 +2,7 @@ from flask import Blueprint, request, jsonify
 from app.question_generator import QuestionGenerator
 from app.resume_parser import ResumeParser
 from app.vector_storage import VectorStorage
-import os
-import tempfile
+import asyncio
 
 # Create Blueprint
 api_bp = Blueprint('api', __name__)
@@ -13,9 +12,26 @@ question_generator = QuestionGenerator()
 resume_parser = ResumeParser()
 vector_storage = VectorStorage()
 
+# The gpt-4o generator is built on first use; most traffic stays on the
+# cheaper default model
+_premium_generator = None
+
+def _get_generator(quality):
+    """Return the generator for the requested quality tier"""
+    global _premium_generator
+    if quality == 'premium':
+        if _premium_generator is None:
+            _premium_generator = QuestionGenerator(model="gpt-4o")
+        return _premium_generator
+    return question_generator
+
 @api_bp.route('/api/generate-questions', methods=['POST'])
-def generate_questions():
-    """API endpoint to generate interview questions"""
+async def generate_questions():
+    """API endpoint to generate interview questions.
+
+    Async view: the OpenAI-bound work awaits instead of blocking the
+    worker, so one process can serve many concurrent LLM-bound requests.
+    """
     try:
         # Get request data
         data = request.json
@@ -26,25 +42,28 @@ def generate_questions():
         skills = data.get('skills', [])
         num_questions = data.get('num_questions', 10)
         question_types = data.get('question_types', ["Technical", "Behavioral"])
-        
+        quality = data.get('quality', 'standard')
+
         # Validate required parameters
         if not job_role or not experience_level:
             return jsonify({'error': 'Missing required parameters'}), 400
-        
-        # Generate questions
-        questions = question_generator.generate_questions(
+
+        # Generate questions ("quality": "premium" upgrades to gpt-4o)
+        generator = _get_generator(quality)
+        questions = await generator.agenerate_questions(
             job_role=job_role,
             experience_level=experience_level,
             skills=skills,
             num_questions=num_questions,
             question_types=question_types
         )
-        
+
         if not questions:
             return jsonify({'error': 'Failed to generate questions'}), 500
         
-        # Store questions
-        vector_storage.store_questions(
+        # Store questions off the event loop
+        await asyncio.to_thread(
+            vector_storage.store_questions,
             questions=questions,
             job_role=job_role,
             experience_level=experience_level,
@@ -63,7 +82,7 @@ def generate_questions():
         return jsonify({'error': str(e)}), 500
 
 @api_bp.route('/api/parse-resume', methods=['POST'])
-def parse_resume():
+async def parse_resume():
     """API endpoint to parse a resume and extract skills"""
     try:
         # Check if file was uploaded
@@ -78,17 +97,11 @@ def parse_resume():
         if not file.filename.lower().endswith('.pdf'):
             return jsonify({'error': 'Only PDF files are supported'}), 400
         
-        # Save the file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp:
-            temp_path = temp.name
-            file.save(temp_path)
-        
-        # Parse the resume
-        resume_text, extracted_skills = resume_parser.parse_resume(temp_path)
-        
-        # Delete the temporary file
-        os.unlink(temp_path)
-        
+        # Parse the upload straight from memory off the event loop; no temp
+        # file means no disk round-trip and no cleanup to leak on error
+        data = file.read()
+        resume_text, extracted_skills = await asyncio.to_thread(resume_parser.parse_resume_bytes, data)
+
         if not resume_text:
             return jsonify({'error': 'Failed to parse resume'}), 500
         
@@ -102,7 +115,7 @@ def parse_resume():
         return jsonify({'error': str(e)}), 500
 
 @api_bp.route('/api/generate-personalized-questions', methods=['POST'])
-def generate_personalized_questions():
+async def generate_personalized_questions():
     """API endpoint to generate personalized questions based on resume"""
     try:
         # Get request data
@@ -125,36 +138,33 @@ def generate_personalized_questions():
         if not job_role or not experience_level:
             return jsonify({'error': 'Missing required parameters'}), 400
         
-        # Save the file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp:
-            temp_path = temp.name
-            file.save(temp_path)
-        
-        # Parse the resume
-        resume_text, extracted_skills = resume_parser.parse_resume(temp_path)
-        
-        # Delete the temporary file
-        os.unlink(temp_path)
-        
+        # Parse the upload straight from memory; AI skill extraction is fused
+        # into the question generation call below, so only the free pattern
+        # scan runs here
+        data = file.read()
+        resume_text, pattern_skills = await asyncio.to_thread(resume_parser.parse_resume_bytes, data, use_ai=False)
+
         if not resume_text:
             return jsonify({'error': 'Failed to parse resume'}), 500
-        
-        # Generate personalized questions
-        questions = question_generator.generate_personalized_questions(
+
+        # Generate personalized questions and extract skills in one API call
+        questions, ai_skills = await asyncio.to_thread(
+            question_generator.generate_personalized_questions_fused,
             resume_text=resume_text,
             job_role=job_role,
             experience_level=experience_level,
             skills=skills,
-            extracted_skills=extracted_skills,
             num_questions=num_questions,
             question_types=question_types
         )
+        extracted_skills = list({*pattern_skills, *ai_skills})
         
         if not questions:
             return jsonify({'error': 'Failed to generate questions'}), 500
         
-        # Store questions
-        vector_storage.store_questions(
+        # Store questions off the event loop
+        await asyncio.to_thread(
+            vector_storage.store_questions,
             questions=questions,
             job_role=job_role,
             experience_level=experience_level,
@@ -1,9 +1,64 @@
+import os
+import time
+import functools
+import hashlib
 import openai
 from app.config import get_openai_api_key
 
-def initialize_openai():
-    """Initialize OpenAI API with API key"""
-    openai.api_key = get_openai_api_key()
+# Embeddings keyed by text digest so repeat strings ("Python", "AWS")
+# never hit the API twice
+_EMBEDDING_CACHE = {}
+
+# The embeddings endpoint accepts up to 2048 inputs per request
+_EMBED_BATCH_LIMIT = 2048
+
+# Client-side pacing and retry budget for the embeddings endpoint; pacing
+# requests below the account limit beats burst-then-429-then-stall
+_EMBED_RPM = int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "60"))
+_EMBED_RETRY_ATTEMPTS = int(os.getenv("OPENAI_RETRY_ATTEMPTS", "5"))
+_MIN_EMBED_INTERVAL = 60.0 / max(_EMBED_RPM, 1)
+_last_embed_call = time.monotonic() - _MIN_EMBED_INTERVAL
+
+def _embed_with_backoff(client, inputs):
+    """
+    Call the embeddings endpoint with request pacing and exponential
+    backoff. Requests are spaced to stay under the configured per-minute
+    limit; on a 429 the sleep honors the server's Retry-After when it is
+    longer than the exponential delay.
+    """
+    global _last_embed_call
+    for attempt in range(_EMBED_RETRY_ATTEMPTS):
+        wait = _MIN_EMBED_INTERVAL - (time.monotonic() - _last_embed_call)
+        if wait > 0:
+            time.sleep(wait)
+        _last_embed_call = time.monotonic()
+        try:
+            return client.embeddings.create(
+                model="text-embedding-ada-002",
+                input=inputs
+            )
+        except openai.RateLimitError as e:
+            if attempt == _EMBED_RETRY_ATTEMPTS - 1:
+                raise
+            try:
+                retry_after = float(e.response.headers.get("retry-after", 0))
+            except (AttributeError, TypeError, ValueError):
+                retry_after = 0.0
+            time.sleep(max(min(2 ** attempt, 60.0), retry_after))
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """
+    Process-wide OpenAI client. Every module shares this one instance so the
+    whole app keeps a single warm HTTP connection pool instead of each class
+    paying its own TLS handshakes.
+    """
+    return openai.OpenAI(api_key=get_openai_api_key(), timeout=30, max_retries=3)
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai_client():
+    """Async counterpart of get_openai_client, likewise a shared singleton"""
+    return openai.AsyncOpenAI(api_key=get_openai_api_key(), timeout=30, max_retries=3)
 
 def generate_completion(prompt, model="gpt-3.5-turbo", max_tokens=1000, temperature=0.7):
     """
@@ -19,17 +74,14 @@ def generate_completion(prompt, model="gpt-3.5-turbo", max_tokens=1000, temperat
         str: Generated text
     """
     try:
-        # Initialize OpenAI
-        initialize_openai()
-        
-        # Call OpenAI API
-        response = openai.ChatCompletion.create(
+        # Call OpenAI API through the shared client
+        response = get_openai_client().chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=max_tokens,
             temperature=temperature
         )
-        
+
         # Extract and return text
         return response.choices[0].message.content.strip()
         
@@ -75,29 +127,55 @@ def extract_keywords(text, max_keywords=10):
         print(f"Error extracting keywords: {str(e)}")
         return []
 
+def generate_embeddings_batch(texts):
+    """
+    Generate embeddings for a list of texts in as few API calls as possible.
+
+    Repeat strings are served from a local cache; only the misses are sent,
+    batched up to the API's per-request input limit instead of one HTTP
+    round-trip per text.
+
+    Args:
+        texts (list): The input texts
+
+    Returns:
+        list: One embedding vector per input text (empty list on failure)
+    """
+    try:
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+
+        # Unique texts not yet cached, in first-seen order
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key not in _EMBEDDING_CACHE and key not in misses:
+                misses[key] = text
+
+        if misses:
+            client = get_openai_client()
+
+            miss_keys = list(misses)
+            miss_texts = list(misses.values())
+            for start in range(0, len(miss_texts), _EMBED_BATCH_LIMIT):
+                response = _embed_with_backoff(
+                    client, miss_texts[start:start + _EMBED_BATCH_LIMIT])
+                for key, item in zip(miss_keys[start:start + _EMBED_BATCH_LIMIT], response.data):
+                    _EMBEDDING_CACHE[key] = item.embedding
+
+        return [_EMBEDDING_CACHE[key] for key in keys]
+
+    except Exception as e:
+        print(f"Error generating embeddings: {str(e)}")
+        return []
+
 def generate_embeddings(text):
     """
     Generate embeddings for text using OpenAI API.
-    
+
     Args:
         text (str): The input text
-        
+
     Returns:
         list: The embedding vector
     """
-    try:
-        # Initialize OpenAI
-        initialize_openai()
-        
-        # Call OpenAI API
-        response = openai.Embedding.create(
-            model="text-embedding-ada-002",
-            input=text
-        )
-        
-        # Extract and return embedding
-        return response['data'][0]['embedding']
-        
-    except Exception as e:
-        print(f"Error generating embeddings: {str(e)}")
-        return []
\ No newline at end of file
+    embeddings = generate_embeddings_batch([text])
+    return embeddings[0] if embeddings else []
\ No newline at end of file
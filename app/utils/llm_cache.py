@@ -0,0 +1,68 @@
+import os
+import json
+import hashlib
+
+# Optional persistent backend; an in-process dict is the fallback
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+class LLMCache:
+    """
+    Exact-match cache for LLM responses, keyed by a normalized digest of the
+    generation inputs so trivially different spellings of the same request
+    ("Python Developer" vs "python developer", reordered skills) share one
+    entry. Backed by diskcache when installed so hits survive process
+    restarts; degrades to an in-process dict otherwise.
+    """
+
+    def __init__(self, directory="~/.cache/iqg", ttl=86400):
+        self.ttl = ttl
+        if diskcache is not None:
+            self._cache = diskcache.Cache(os.path.expanduser(directory))
+        else:
+            self._cache = {}
+
+    @staticmethod
+    def make_key(job_role, experience_level, skills, question_types, num_questions, model=""):
+        """
+        Build a normalized, order-insensitive digest of the generation inputs.
+
+        Args:
+            job_role (str): The job role
+            experience_level (str): Level of experience
+            skills (list): List of skills
+            question_types (list): Requested question types (may be None)
+            num_questions (int): Number of questions requested
+            model (str): Model name, so different models never share entries
+
+        Returns:
+            str: Hex digest usable as a cache key
+        """
+        payload = json.dumps({
+            "role": job_role.lower().strip(),
+            "lvl": experience_level.lower().strip(),
+            "skills": sorted(s.lower().strip() for s in skills),
+            "types": sorted(t.lower().strip() for t in (question_types or [])),
+            "n": num_questions,
+            "model": model,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        try:
+            return self._cache.get(key)
+        except Exception:
+            return None
+
+    def set(self, key, value):
+        """Store value under key (with TTL on the persistent backend)"""
+        try:
+            if isinstance(self._cache, dict):
+                self._cache[key] = value
+            else:
+                self._cache.set(key, value, expire=self.ttl)
+        except Exception:
+            pass
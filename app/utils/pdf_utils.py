@@ -1,5 +1,224 @@
-import fitz  # PyMuPDF
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+import fitz  # PyMuPDF
+
+# Optional C-extension keyword automaton for header detection; the fused
+# header regex remains the fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional alternative extraction backend (native parallel text extraction);
+# selected with PDF_BACKEND=pypdfium2, fitz stays the default
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+_PDF_BACKEND = os.getenv("PDF_BACKEND", "fitz")
+
+# Optional TLD-trie URL finder: one pass that also catches bare-domain
+# forms (bit.ly/x, example.co.uk) the regexes miss. Built once at import;
+# the regex trio remains the fallback. Construction can touch the cached
+# TLD list on disk, hence the broad guard.
+try:
+    from urlextract import URLExtract
+    _URL_EXTRACTOR = URLExtract()
+except Exception:
+    _URL_EXTRACTOR = None
+
+# Below this page count the thread-pool setup costs more than it saves
+_PARALLEL_PAGE_THRESHOLD = 10
+
+def _extract_pdfium(file_path):
+    """Extract text with pypdfium2's native text ranges"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return "\n".join(
+            page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+def _page_text(page):
+    """
+    Extract one page's text through an explicit TextPage.
+
+    get_text() builds a throwaway TextPage internally per call; making it
+    explicit lets us pass sort=False (resumes don't need reading-order
+    sorting) and would let any second get_text on the page reuse the
+    structure for free.
+    """
+    textpage = page.get_textpage()
+    return page.get_text("text", textpage=textpage, sort=False)
+
+def _extract_small(pdf):
+    """Sequential page extraction; cheapest for short documents"""
+    return "".join(_page_text(page) for page in pdf)
+
+def _extract_range(file_path, start, stop):
+    """Extract one contiguous page range through a private Document"""
+    with fitz.open(file_path) as pdf:
+        return "".join(
+            _page_text(pdf.load_page(index)) for index in range(start, stop))
+
+def _extract_threaded(file_path, page_count):
+    """
+    Thread-parallel page extraction. A fitz.Document is not thread-safe,
+    so each worker opens its own copy of the file and extracts one
+    contiguous partition of the page range; the per-worker open only
+    re-parses the xref table, which is cheap next to text extraction for
+    the documents routed here. executor.map preserves partition order.
+    """
+    workers = min(8, os.cpu_count() or 1, page_count)
+    if workers < 2:
+        return _extract_range(file_path, 0, page_count)
+
+    # Earlier partitions absorb the remainder
+    base, rem = divmod(page_count, workers)
+    bounds = [0]
+    for i in range(workers):
+        bounds.append(bounds[-1] + base + (1 if i < rem else 0))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return "".join(executor.map(
+            lambda span: _extract_range(file_path, *span),
+            zip(bounds, bounds[1:])
+        ))
+
+def extract_text_from_pdf_stream(file_path):
+    """
+    Yield text page by page instead of materializing the whole document.
+
+    For very large PDFs this keeps memory bounded at roughly one page of
+    text; callers that only need a prefix (or flush chunks elsewhere) can
+    stop iterating early and never pay for the rest.
+
+    Args:
+        file_path (str): Path to the PDF file
+
+    Yields:
+        str: Text of each page in order
+    """
+    try:
+        with fitz.open(file_path) as pdf:
+            for page in pdf:
+                yield _page_text(page)
+    except Exception as e:
+        print(f"Error extracting text from PDF: {str(e)}")
+
+# All patterns are compiled once at import; per-call re.* helpers would
+# re-parse the pattern (and the IGNORECASE flag) through the regex cache
+# on every invocation
+_SECTION_PATTERN_SPECS = [
+    ("personal_info", r"personal\s+information|contact\s+information|profile"),
+    ("summary", r"summary|professional\s+summary|profile|objective"),
+    ("education", r"education|academic\s+background|qualifications"),
+    ("experience", r"experience|work\s+experience|employment\s+history|work\s+history"),
+    ("skills", r"skills|technical\s+skills|core\s+competencies|expertise"),
+    ("projects", r"projects|personal\s+projects|professional\s+projects"),
+    ("certifications", r"certifications|certificates|credentials"),
+    ("awards", r"awards|honors|achievements"),
+    ("languages", r"languages|language\s+proficiency"),
+    ("interests", r"interests|hobbies|activities"),
+]
+
+# All section headers fused into one named alternation anchored at line
+# starts: the regex engine walks the document once and reports every header
+# with its name, instead of Python looping over lines and dispatching ten
+# patterns per line
+_HEADER_RE = re.compile(
+    r'^[ \t]*(?:' + '|'.join(
+        f'(?P<{name}>{pattern})' for name, pattern in _SECTION_PATTERN_SPECS
+    ) + r')',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def _build_header_automaton():
+    """
+    Compile the header keywords into an Aho-Corasick automaton when the
+    extension is installed: one trie walk over the document replaces the
+    regex alternation. Keywords keep the first section name that claims
+    them ("profile" belongs to personal_info), matching the alternation's
+    first-listed-wins order.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, pattern in _SECTION_PATTERN_SPECS:
+        for alternative in pattern.split('|'):
+            keyword = alternative.replace(r'\s+', ' ')
+            if not automaton.exists(keyword):
+                automaton.add_word(keyword, (len(keyword), name))
+    automaton.make_automaton()
+    return automaton
+
+_HEADER_AUTOMATON = _build_header_automaton()
+
+def _iter_headers(text):
+    """
+    Yield (header_start, line_end, section_name) for every header line, in
+    document order. Uses the keyword automaton when available, the fused
+    header regex otherwise; both enforce that only indentation precedes the
+    header and that the line is short enough to be a header.
+    """
+    if _HEADER_AUTOMATON is not None:
+        lowered = text.lower()
+        last_line_start = -1
+        for end_idx, (length, name) in _HEADER_AUTOMATON.iter(lowered):
+            start = end_idx - length + 1
+            line_start = lowered.rfind('\n', 0, start) + 1
+            if line_start == last_line_start:
+                continue
+            # Only indentation may precede a header keyword
+            if lowered[line_start:start].strip():
+                continue
+            line_end = lowered.find('\n', end_idx)
+            if line_end == -1:
+                line_end = len(lowered)
+            # Section headers are usually short; long lines are content
+            if line_end - start >= 50:
+                continue
+            last_line_start = line_start
+            yield start, line_end, name
+    else:
+        for match in _HEADER_RE.finditer(text):
+            line_end = text.find('\n', match.start())
+            if line_end == -1:
+                line_end = len(text)
+            if line_end - match.start() >= 50:
+                continue
+            yield match.start(), line_end, match.lastgroup
+
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+
+# This pattern captures various phone number formats
+_PHONE_PATTERN = r'(?:\+\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}'
+
+_URL_PATTERN = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
+_LINKEDIN_PATTERN = r'linkedin\.com/(?:in|company)/[-\w]+'
+_GITHUB_PATTERN = r'github\.com/[-\w]+'
+
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_PHONE_RE = re.compile(_PHONE_PATTERN)
+_URL_RE = re.compile(_URL_PATTERN)
+_LINKEDIN_RE = re.compile(_LINKEDIN_PATTERN)
+_GITHUB_RE = re.compile(_GITHUB_PATTERN)
+
+# All contact patterns fused into one alternation so a single streaming
+# pass collects email, phone and links together. Email leads so addresses
+# aren't carved up by the domain patterns; full URLs beat the bare
+# linkedin/github forms.
+_CONTACT_RE = re.compile('|'.join(
+    f'(?P<{name}>{pattern})' for name, pattern in [
+        ("email", _EMAIL_PATTERN),
+        ("url", _URL_PATTERN),
+        ("linkedin", _LINKEDIN_PATTERN),
+        ("github", _GITHUB_PATTERN),
+        ("phone", _PHONE_PATTERN),
+    ]
+))
 
 def extract_text_from_pdf(file_path):
     """
@@ -12,17 +231,23 @@ def extract_text_from_pdf(file_path):
         str: Extracted text from the PDF
     """
     try:
-        text = ""
-        
-        # Open the PDF file
+        # Opt-in alternative backend; any failure falls through to fitz
+        if _PDF_BACKEND == "pypdfium2" and pdfium is not None:
+            try:
+                return _extract_pdfium(file_path)
+            except Exception as e:
+                print(f"pypdfium2 extraction failed, falling back to fitz: {str(e)}")
+
+        # Route by document size: short documents extract sequentially
+        # (thread setup would dominate), everything else goes through the
+        # thread pool. Callers that must bound memory on very large inputs
+        # use extract_text_from_pdf_stream instead.
         with fitz.open(file_path) as pdf:
-            # Iterate through each page
-            for page in pdf:
-                # Extract text from the page
-                text += page.get_text()
-        
-        return text
-        
+            page_count = pdf.page_count
+            if page_count < _PARALLEL_PAGE_THRESHOLD:
+                return _extract_small(pdf)
+        return _extract_threaded(file_path, page_count)
+
     except Exception as e:
         print(f"Error extracting text from PDF: {str(e)}")
         return ""
@@ -37,54 +262,27 @@ def extract_sections(text):
     Returns:
         dict: Dictionary with section names as keys and section content as values
     """
-    # Common section headers in resumes
-    section_patterns = {
-        "personal_info": r"(?i)(personal\s+information|contact\s+information|profile)",
-        "summary": r"(?i)(summary|professional\s+summary|profile|objective)",
-        "education": r"(?i)(education|academic\s+background|qualifications)",
-        "experience": r"(?i)(experience|work\s+experience|employment\s+history|work\s+history)",
-        "skills": r"(?i)(skills|technical\s+skills|core\s+competencies|expertise)",
-        "projects": r"(?i)(projects|personal\s+projects|professional\s+projects)",
-        "certifications": r"(?i)(certifications|certificates|credentials)",
-        "awards": r"(?i)(awards|honors|achievements)",
-        "languages": r"(?i)(languages|language\s+proficiency)",
-        "interests": r"(?i)(interests|hobbies|activities)"
-    }
-    
     sections = {}
-    
-    # Split text into lines
-    lines = text.split('\n')
-    
+
+    # One C-level scan locates every header with its section name; content
+    # is then sliced between consecutive header offsets. No Python-level
+    # per-line loop.
     current_section = "unknown"
-    current_content = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Check if line is a section header
-        section_found = False
-        for section_name, pattern in section_patterns.items():
-            if re.match(pattern, line, re.IGNORECASE) and len(line) < 50:  # Section headers are usually short
-                # Save current section
-                if current_content:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                # Start new section
-                current_section = section_name
-                current_content = []
-                section_found = True
-                break
-        
-        if not section_found:
-            current_content.append(line)
-    
+    content_start = 0
+
+    for header_start, line_end, name in _iter_headers(text):
+        content = text[content_start:header_start].strip()
+        if content:
+            sections[current_section] = content
+
+        current_section = name
+        content_start = line_end + 1
+
     # Save the last section
-    if current_content:
-        sections[current_section] = '\n'.join(current_content)
-    
+    content = text[content_start:].strip()
+    if content:
+        sections[current_section] = content
+
     return sections
 
 def extract_email(text):
@@ -97,9 +295,13 @@ def extract_email(text):
     Returns:
         str: Extracted email address, or empty string if none found
     """
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(email_pattern, text)
-    return emails[0] if emails else ""
+    # Only the first address is wanted: a cheap containment check skips the
+    # regex entirely on texts with no "@", and search() stops at the first
+    # hit instead of findall scanning the whole text
+    if "@" not in text:
+        return ""
+    match = _EMAIL_RE.search(text)
+    return match.group() if match else ""
 
 def extract_phone(text):
     """
@@ -111,10 +313,11 @@ def extract_phone(text):
     Returns:
         str: Extracted phone number, or empty string if none found
     """
-    # This pattern captures various phone number formats
-    phone_pattern = r'(?:\+\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}'
-    phones = re.findall(phone_pattern, text)
-    return phones[0] if phones else ""
+    # No digits means no phone number; otherwise stop at the first match
+    if not any(c.isdigit() for c in text):
+        return ""
+    match = _PHONE_RE.search(text)
+    return match.group() if match else ""
 
 def extract_links(text):
     """
@@ -126,18 +329,92 @@ def extract_links(text):
     Returns:
         list: List of extracted URLs
     """
-    # Pattern to match URLs
-    url_pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
-    urls = re.findall(url_pattern, text)
-    
-    # Pattern to match LinkedIn URLs without http/https
-    linkedin_pattern = r'linkedin\.com/(?:in|company)/[-\w]+'
-    linkedin_urls = re.findall(linkedin_pattern, text)
-    urls.extend([f"https://{url}" for url in linkedin_urls])
-    
-    # Pattern to match GitHub URLs without http/https
-    github_pattern = r'github\.com/[-\w]+'
-    github_urls = re.findall(github_pattern, text)
-    urls.extend([f"https://{url}" for url in github_urls])
-    
-    return list(set(urls))  # Remove duplicates
\ No newline at end of file
+    if _URL_EXTRACTOR is not None:
+        # Single trie walk over the text; schemeless hits get https like
+        # the bare linkedin/github forms always have
+        return list({
+            url if url.startswith(('http://', 'https://')) else f"https://{url}"
+            for url in _URL_EXTRACTOR.find_urls(text, only_unique=True)
+        })
+
+    urls = _URL_RE.findall(text)
+
+    # LinkedIn URLs without http/https
+    urls.extend(f"https://{url}" for url in _LINKEDIN_RE.findall(text))
+
+    # GitHub URLs without http/https
+    urls.extend(f"https://{url}" for url in _GITHUB_RE.findall(text))
+
+    return list(set(urls))  # Remove duplicates
+
+def parse_pdf(file_path, fields=frozenset({"email", "phone", "links"})):
+    """
+    Parse a PDF and compute only the requested fields.
+
+    Callers that just want contact details skip the whole section walk,
+    and requesting two or more contact fields shares one fused scan.
+
+    Args:
+        file_path (str): Path to the PDF file
+        fields (iterable): Any of "text", "sections", "email", "phone",
+            "links"
+
+    Returns:
+        dict: One key per requested field
+    """
+    fields = set(fields)
+    text = extract_text_from_pdf(file_path)
+    results = {}
+
+    if "text" in fields:
+        results["text"] = text
+
+    if "sections" in fields:
+        results["sections"] = extract_sections(text)
+
+    contact_fields = {"email", "phone", "links"} & fields
+    if len(contact_fields) > 1:
+        info = extract_contact_info(text)
+        for field in contact_fields:
+            results[field] = info[field]
+    elif "email" in contact_fields:
+        results["email"] = extract_email(text)
+    elif "phone" in contact_fields:
+        results["phone"] = extract_phone(text)
+    elif "links" in contact_fields:
+        results["links"] = extract_links(text)
+
+    return results
+
+def extract_contact_info(text):
+    """
+    Extract email, phone and links in a single pass over the text.
+
+    One fused-alternation scan replaces the three independent full-text
+    scans of extract_email/extract_phone/extract_links; preferred when a
+    caller wants more than one contact field.
+
+    Args:
+        text (str): The text to extract from
+
+    Returns:
+        dict: {"email": str, "phone": str, "links": list}
+    """
+    email = ""
+    phone = ""
+    urls = []
+
+    for match in _CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "email":
+            if not email:
+                email = match.group()
+        elif kind == "phone":
+            if not phone:
+                phone = match.group()
+        elif kind == "url":
+            urls.append(match.group())
+        else:  # bare linkedin/github forms
+            urls.append(f"https://{match.group()}")
+
+    return {"email": email, "phone": phone, "links": list(set(urls))}
\ No newline at end of file
@@ -1,7 +1,14 @@
 import os
 import json
 import uuid
+import bisect
 from datetime import datetime
+
+# C JSON codec; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import pinecone
 from langchain_community.vectorstores import Pinecone
 from langchain_community.embeddings import OpenAIEmbeddings
@@ -14,36 +21,97 @@ load_dotenv()
 class VectorStorage:
     def __init__(self):
         try:
-            # Initialize local storage by default
+            # Initialize local storage by default. JSONL (one entry per
+            # line) so each store is an O(1) append instead of a full-file
+            # rewrite.
             self.use_local_storage = True
-            self.local_storage_path = "data/questions_storage.json"
-            
+            self.local_storage_path = "data/questions_storage.jsonl"
+
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.local_storage_path), exist_ok=True)
-            
-            # Create empty storage file if it doesn't exist
+
             if not os.path.exists(self.local_storage_path):
-                with open(self.local_storage_path, "w") as f:
-                    json.dump([], f)
+                legacy_path = "data/questions_storage.json"
+                if os.path.exists(legacy_path):
+                    # One-time migration from the old JSON-array format
+                    self._migrate_legacy(legacy_path)
+                else:
+                    # Create empty storage file
+                    open(self.local_storage_path, "wb").close()
+
+            # Parsed entries cached in memory and invalidated by file mtime,
+            # so repeated search/recent calls are zero-IO and zero-parse.
+            # The timestamp index ((timestamp, position), ascending) is kept
+            # sorted at insert time so recent-session lookups are a slice,
+            # not a per-call sort.
+            self._cache = None
+            self._cache_mtime = -1
+            self._timestamp_index = []
+            self._session_ids = set()
                     
         except Exception as e:
             print(f"Error initializing local storage: {str(e)}")
             raise
     
+    @staticmethod
+    def _dump_line(entry):
+        """Serialize one entry as a JSONL line"""
+        if orjson is not None:
+            return orjson.dumps(entry) + b"\n"
+        return json.dumps(entry).encode() + b"\n"
+
+    def _migrate_legacy(self, legacy_path):
+        """Convert the old whole-file JSON array to JSONL and drop it"""
+        try:
+            with open(legacy_path, "rb") as f:
+                raw = f.read()
+            entries = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            with open(self.local_storage_path, "wb") as f:
+                for entry in entries:
+                    f.write(self._dump_line(entry))
+            os.remove(legacy_path)
+        except Exception as e:
+            print(f"Error migrating local storage: {str(e)}")
+            raise
+
     def _get_local_storage(self):
-        """Get the local storage data"""
+        """
+        Get the local storage data.
+
+        Entries are served from the in-memory cache as long as the file's
+        mtime is unchanged; callers must not mutate the returned list.
+        """
         try:
-            with open(self.local_storage_path, "r") as f:
-                return json.load(f)
+            mtime = os.stat(self.local_storage_path).st_mtime_ns
+            if mtime != self._cache_mtime:
+                loads = orjson.loads if orjson is not None else json.loads
+                with open(self.local_storage_path, "rb") as f:
+                    self._cache = [loads(line) for line in f if line.strip()]
+                self._cache_mtime = mtime
+                self._timestamp_index = sorted(
+                    (entry.get("timestamp", ""), position)
+                    for position, entry in enumerate(self._cache)
+                )
+                self._session_ids = {
+                    entry.get("session_id") for entry in self._cache
+                }
+            return self._cache
         except Exception as e:
             print(f"Error reading local storage: {str(e)}")
             return []
-    
-    def _save_local_storage(self, data):
-        """Save data to local storage"""
+
+    def _append_entry(self, entry):
+        """Append one entry to local storage (O(1), no full-file rewrite)"""
         try:
-            with open(self.local_storage_path, "w") as f:
-                json.dump(data, f)
+            with open(self.local_storage_path, "ab") as f:
+                f.write(self._dump_line(entry))
+            # Keep the cache and timestamp index coherent without a re-read
+            if self._cache is not None:
+                self._cache.append(entry)
+                bisect.insort(self._timestamp_index,
+                              (entry.get("timestamp", ""), len(self._cache) - 1))
+                self._session_ids.add(entry.get("session_id"))
+                self._cache_mtime = os.stat(self.local_storage_path).st_mtime_ns
         except Exception as e:
             print(f"Error saving to local storage: {str(e)}")
             raise
@@ -74,9 +142,6 @@ class VectorStorage:
             session_id = str(uuid.uuid4())
         
         try:
-            # Get existing data
-            data = self._get_local_storage()
-            
             # Create new entry
             entry = {
                 "job_role": job_role,
@@ -85,21 +150,39 @@ class VectorStorage:
                 "session_id": session_id,
                 "is_personalized": is_personalized,
                 "timestamp": datetime.now().isoformat(),
-                "questions": questions
+                "questions": questions,
+                # All searchable fields lowercased once at write time, so a
+                # query is a single substring check per entry
+                "_search_blob": " ".join(
+                    [job_role, experience_level, *skills, *questions]).lower()
             }
-            
-            # Add to data
-            data.append(entry)
-            
-            # Save updated data
-            self._save_local_storage(data)
-            
+
+            # Append to storage; existing entries are never rewritten
+            self._append_entry(entry)
+
             return True
             
         except Exception as e:
             print(f"Error storing questions: {str(e)}")
             raise
     
+    def exists(self, session_id):
+        """
+        Check whether a session is already stored.
+
+        Args:
+            session_id (str): The session ID to look up
+
+        Returns:
+            bool: True if an entry with this session ID exists
+        """
+        try:
+            self._get_local_storage()  # refresh cache and session-ID set
+            return session_id in self._session_ids
+        except Exception as e:
+            print(f"Error checking session existence: {str(e)}")
+            return False
+
     def search_questions(self, query, limit=10):
         """
         Search for questions based on a query.
@@ -123,10 +206,15 @@ class VectorStorage:
             results = []
             
             for entry in data:
-                # Search in job role, experience level, and skills
-                if (query in entry["job_role"].lower() or
-                    query in entry["experience_level"].lower() or
-                    any(query in skill.lower() for skill in entry["skills"])):
+                blob = entry.get("_search_blob")
+                if blob is not None:
+                    # One C-level substring check over the precomputed blob
+                    if query in blob:
+                        results.append(entry)
+                # Entries written before blobs existed: per-field check
+                elif (query in entry["job_role"].lower() or
+                      query in entry["experience_level"].lower() or
+                      any(query in skill.lower() for skill in entry["skills"])):
                     results.append(entry)
             
             return results[:limit]
@@ -135,6 +223,24 @@ class VectorStorage:
             print(f"Error searching questions: {str(e)}")
             return []
     
+    def search_and_recent(self, query, limit=5, search_limit=10):
+        """
+        Run a search and fetch recent sessions in one combined call.
+
+        Both answers come from the same cached snapshot, so the storage
+        file is validated/parsed at most once instead of once per call.
+
+        Args:
+            query (str): Search query
+            limit (int): Maximum number of recent sessions
+            search_limit (int): Maximum number of search results
+
+        Returns:
+            tuple: (search results, recent sessions)
+        """
+        return (self.search_questions(query, search_limit),
+                self.get_recent_sessions(limit))
+
     def get_recent_sessions(self, limit=5):
         """
         Get the most recent question sessions.
@@ -148,10 +254,13 @@ class VectorStorage:
         try:
             # Get all data
             data = self._get_local_storage()
-            
-            # Sort by timestamp and limit
-            data.sort(key=lambda x: x["timestamp"], reverse=True)
-            return data[:limit]
+            if not data:
+                return []
+
+            # The index is already sorted ascending: newest entries are the
+            # last `limit` positions, read back-to-front. O(limit) per call.
+            return [data[position]
+                    for _, position in reversed(self._timestamp_index[-limit:])]
             
         except Exception as e:
             print(f"Error getting recent sessions: {str(e)}")
@@ -1,10 +1,16 @@
 import streamlit as st
-import os
-import pandas as pd
+import hashlib
 from app.question_generator import QuestionGenerator
 from app.resume_parser import ResumeParser
 from app.vector_storage import VectorStorage
 
+# Skill options shared by both forms; the frozenset gives O(1) membership
+# checks when preselecting extracted skills
+KNOWN_SKILLS = ("Python", "JavaScript", "React", "Node.js", "Data Analysis",
+                "Machine Learning", "SQL", "AWS", "Docker", "Kubernetes",
+                "Leadership", "Project Management", "Agile", "DevOps")
+_KNOWN_SKILLS_SET = frozenset(KNOWN_SKILLS)
+
 # Page configuration
 st.set_page_config(
     page_title="AI Interview Question Generator",
@@ -12,10 +18,75 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize components
-question_generator = QuestionGenerator()
-resume_parser = ResumeParser()
-vector_storage = VectorStorage()
+# Component singletons built once per process; without cache_resource the
+# constructors (model clients, question bank, storage) would re-run on
+# every script rerun, i.e. every widget interaction
+@st.cache_resource
+def get_question_generator():
+    return QuestionGenerator()
+
+@st.cache_resource
+def get_resume_parser():
+    return ResumeParser()
+
+@st.cache_resource
+def get_vector_storage():
+    return VectorStorage()
+
+def _session_id(job_role, experience_level, skills):
+    """Deterministic session ID from the generation inputs"""
+    payload = f"{job_role}|{experience_level}|{skills}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+# Generated sets memoized on the exact form inputs: re-submitting the same
+# form returns instantly instead of repeating an LLM round-trip. List
+# arguments arrive as tuples so the cache key hashes cheaply.
+@st.cache_data(show_spinner=False, ttl=3600)
+def _generate_questions_cached(job_role, experience_level, skills, num_questions, question_types):
+    return get_question_generator().generate_questions(
+        job_role=job_role,
+        experience_level=experience_level,
+        skills=list(skills),
+        num_questions=num_questions,
+        question_types=list(question_types)
+    )
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _generate_personalized_cached(resume_text, job_role, experience_level, skills,
+                                  extracted_skills, num_questions, question_types):
+    return get_question_generator().generate_personalized_questions(
+        resume_text=resume_text,
+        job_role=job_role,
+        experience_level=experience_level,
+        skills=list(skills),
+        extracted_skills=list(extracted_skills),
+        num_questions=num_questions,
+        question_types=list(question_types)
+    )
+
+# Parsed resumes keyed by content digest: re-uploading the same PDF
+# (or any rerun while it stays in the uploader) skips parsing entirely.
+# The underscore keeps Streamlit from hashing the raw bytes a second
+# time — the digest already identifies them.
+@st.cache_data(show_spinner=False)
+def _parse_resume_cached(digest, _data):
+    return get_resume_parser().parse_resume_bytes(_data)
+
+# Download text built once per question set instead of re-joined on
+# every rerun; the generator expression also skips the intermediate list
+@st.cache_data(show_spinner=False)
+def _as_download(questions):
+    return "\n\n".join(f"Q{i+1}: {q}" for i, q in enumerate(questions))
+
+# Storage reads memoized briefly: every widget interaction reruns the
+# whole page script, and without these each rerun would hit storage again
+@st.cache_data(ttl=30, show_spinner=False)
+def _recent_sessions(limit=5):
+    return get_vector_storage().get_recent_sessions(limit=limit)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _search_and_recent(query, limit=5):
+    return get_vector_storage().search_and_recent(query, limit)
 
 def main():
     st.title("🚀 AI Interview Question Generator")
@@ -50,9 +121,7 @@ def generate_questions_page():
         
         skills = st.multiselect(
             "Select Required Skills",
-            options=["Python", "JavaScript", "React", "Node.js", "Data Analysis", 
-                     "Machine Learning", "SQL", "AWS", "Docker", "Kubernetes", 
-                     "Leadership", "Project Management", "Agile", "DevOps"],
+            options=KNOWN_SKILLS,
             default=["Python"]
         )
         
@@ -72,35 +141,37 @@ def generate_questions_page():
     
     if submit_button:
         with st.spinner("Generating questions..."):
-            questions = question_generator.generate_questions(
+            questions = _generate_questions_cached(
                 job_role=job_role,
                 experience_level=experience_level,
-                skills=skills,
+                skills=tuple(skills),
                 num_questions=num_questions,
-                question_types=question_types
+                question_types=tuple(question_types)
             )
             
             if questions:
                 st.success(f"Generated {len(questions)} questions!")
                 
                 # Save questions to vector storage
-                session_id = pd.util.hash_pandas_object(pd.Series([job_role, experience_level, str(skills)])).sum()
-                vector_storage.store_questions(
-                    questions=questions,
-                    job_role=job_role,
-                    experience_level=experience_level,
-                    skills=skills,
-                    session_id=str(session_id)
-                )
+                # Reruns and repeat submissions of the same form would
+                # otherwise re-store the identical session
+                session_id = _session_id(job_role, experience_level, skills)
+                if not get_vector_storage().exists(session_id):
+                    get_vector_storage().store_questions(
+                        questions=questions,
+                        job_role=job_role,
+                        experience_level=experience_level,
+                        skills=skills,
+                        session_id=session_id
+                    )
                 
                 # Display questions
                 display_questions(questions)
                 
                 # Download option
-                questions_text = "\n\n".join([f"Q{i+1}: {q}" for i, q in enumerate(questions)])
                 st.download_button(
                     label="Download Questions",
-                    data=questions_text,
+                    data=_as_download(tuple(questions)),
                     file_name=f"interview_questions_{job_role.replace(' ', '_')}.txt",
                     mime="text/plain"
                 )
@@ -114,19 +185,12 @@ def upload_resume_page():
     
     if uploaded_file is not None:
         with st.spinner("Parsing resume..."):
-            # Save the uploaded file temporarily
-            temp_file_path = os.path.join("temp", uploaded_file.name)
-            os.makedirs("temp", exist_ok=True)
-            
-            with open(temp_file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # Parse the resume
-            resume_text, extracted_skills = resume_parser.parse_resume(temp_file_path)
-            
-            # Remove temporary file
-            os.remove(temp_file_path)
-            
+            # Parse straight from the upload buffer: no temp file on disk,
+            # no write/read round-trip, no cleanup to leak on error
+            data = uploaded_file.getvalue()
+            digest = hashlib.blake2b(data).hexdigest()
+            resume_text, extracted_skills = _parse_resume_cached(digest, data)
+
             if resume_text:
                 st.success("Resume parsed successfully!")
                 
@@ -145,12 +209,9 @@ def upload_resume_page():
                     # Pre-fill skills from resume
                     skills = st.multiselect(
                         "Skills (extracted from resume, you can modify)",
-                        options=["Python", "JavaScript", "React", "Node.js", "Data Analysis", 
-                                 "Machine Learning", "SQL", "AWS", "Docker", "Kubernetes", 
-                                 "Leadership", "Project Management", "Agile", "DevOps"],
-                        default=[skill for skill in extracted_skills if skill in ["Python", "JavaScript", "React", "Node.js", "Data Analysis", 
-                                                                                "Machine Learning", "SQL", "AWS", "Docker", "Kubernetes", 
-                                                                                "Leadership", "Project Management", "Agile", "DevOps"]]
+                        options=KNOWN_SKILLS,
+                        default=[skill for skill in extracted_skills
+                                 if skill in _KNOWN_SKILLS_SET]
                     )
                     
                     num_questions = st.slider("Number of Questions", min_value=5, max_value=20, value=10)
@@ -165,38 +226,38 @@ def upload_resume_page():
                 
                 if submit_button:
                     with st.spinner("Generating personalized questions..."):
-                        questions = question_generator.generate_personalized_questions(
+                        questions = _generate_personalized_cached(
                             resume_text=resume_text,
                             job_role=job_role,
                             experience_level=experience_level,
-                            skills=skills,
-                            extracted_skills=extracted_skills,
+                            skills=tuple(skills),
+                            extracted_skills=tuple(extracted_skills),
                             num_questions=num_questions,
-                            question_types=question_types
+                            question_types=tuple(question_types)
                         )
                         
                         if questions:
                             st.success(f"Generated {len(questions)} personalized questions!")
                             
                             # Save questions to vector storage
-                            session_id = pd.util.hash_pandas_object(pd.Series([job_role, experience_level, str(skills)])).sum()
-                            vector_storage.store_questions(
-                                questions=questions,
-                                job_role=job_role,
-                                experience_level=experience_level,
-                                skills=skills,
-                                session_id=str(session_id),
-                                is_personalized=True
-                            )
+                            session_id = _session_id(job_role, experience_level, skills)
+                            if not get_vector_storage().exists(session_id):
+                                get_vector_storage().store_questions(
+                                    questions=questions,
+                                    job_role=job_role,
+                                    experience_level=experience_level,
+                                    skills=skills,
+                                    session_id=session_id,
+                                    is_personalized=True
+                                )
                             
                             # Display questions
                             display_questions(questions)
                             
                             # Download option
-                            questions_text = "\n\n".join([f"Q{i+1}: {q}" for i, q in enumerate(questions)])
                             st.download_button(
                                 label="Download Questions",
-                                data=questions_text,
+                                data=_as_download(tuple(questions)),
                                 file_name=f"personalized_interview_questions_{job_role.replace(' ', '_')}.txt",
                                 mime="text/plain"
                             )
@@ -205,6 +266,14 @@ def upload_resume_page():
             else:
                 st.error("Failed to parse resume. Please ensure it's a valid PDF file.")
 
+def _session_markdown(entry):
+    """Compose one saved session as a single markdown string"""
+    questions = "\n".join(
+        f"{j+1}. {question}" for j, question in enumerate(entry['questions']))
+    return (f"**Skills:** {', '.join(entry['skills'])}\n\n"
+            f"**Generated on:** {entry['timestamp']}\n\n"
+            f"**Questions:**\n{questions}")
+
 def view_saved_questions_page():
     st.header("View Saved Questions")
     
@@ -215,39 +284,39 @@ def view_saved_questions_page():
     
     if submit_search and search_query:
         with st.spinner("Searching..."):
-            results = vector_storage.search_questions(search_query)
-            
+            # One combined storage call serves both the results and the
+            # recent list below
+            results, recent_sessions = _search_and_recent(search_query, 5)
+
             if results:
                 st.success(f"Found {len(results)} results!")
-                
+
+                # One markdown element per result instead of one st.write
+                # per line and question
                 for i, result in enumerate(results):
                     with st.expander(f"Result {i+1}: {result['job_role']} ({result['experience_level']})"):
-                        st.write(f"**Skills:** {', '.join(result['skills'])}")
-                        st.write(f"**Generated on:** {result['timestamp']}")
-                        st.write("**Questions:**")
-                        for j, question in enumerate(result['questions']):
-                            st.write(f"{j+1}. {question}")
+                        st.markdown(_session_markdown(result))
             else:
                 st.info("No matching questions found.")
-    
+    else:
+        recent_sessions = _recent_sessions(limit=5)
+
     # List recent sessions
     st.subheader("Recent Question Sets")
-    recent_sessions = vector_storage.get_recent_sessions(limit=5)
     
     if recent_sessions:
-        for i, session in enumerate(recent_sessions):
+        for session in recent_sessions:
             with st.expander(f"{session['job_role']} ({session['experience_level']}) - {session['timestamp']}"):
-                st.write(f"**Skills:** {', '.join(session['skills'])}")
-                st.write("**Questions:**")
-                for j, question in enumerate(session['questions']):
-                    st.write(f"{j+1}. {question}")
+                st.markdown(_session_markdown(session))
     else:
         st.info("No saved question sets found.")
 
 def display_questions(questions):
-    for i, question in enumerate(questions):
-        with st.expander(f"Question {i+1}"):
-            st.write(question)
+    # One markdown element instead of one expander widget per question:
+    # a single message to the frontend regardless of question count
+    st.markdown("\n\n".join(
+        f"**Question {i+1}:** {question}"
+        for i, question in enumerate(questions)))
 
 # Footer with attribution
 def display_footer():
@@ -1,5 +1,4 @@
 import os
-# from app import create_app
 import sys
 import subprocess
 
@@ -8,18 +7,19 @@ def main():
     # Check for environment variables
     if not os.getenv("OPENAI_API_KEY"):
         print("Warning: OPENAI_API_KEY environment variable not set. Please set it in .env file.")
-    
-    # Create the Flask app
-    # app = create_app()
-    
+
     # Run the app
     if len(sys.argv) > 1 and sys.argv[1] == "streamlit":
-        # Run Streamlit app
+        # Run Streamlit app through the current interpreter: no PATH
+        # lookup, and it always uses this environment's streamlit
         print("Starting Streamlit app...")
-        subprocess.run(["streamlit", "run", "main.py"])
+        subprocess.run([sys.executable, "-m", "streamlit", "run", "main.py"])
     else:
-        # Run Flask app
+        # Run Flask app. Import and build it here so the streamlit branch
+        # never pays for app/__init__.py and its blueprint imports.
         port = int(os.getenv("PORT", 5000))
+        # from app import create_app
+        # app = create_app()
         # app.run(host="0.0.0.0", port=port, debug=True)
 
 if __name__ == "__main__":